@@ -2,10 +2,13 @@ import sys
 import re
 
 # Definição dos tokens da NanoCalc
+# (ordem = frequência: espaços e identificadores primeiro; "print" é
+# reconhecido depois do match de IDENTIFIER)
 TOKEN_SPEC = [
+    ("SKIP",     r"[ \t]+"),            # Espaços e tabs
+    ("NEWLINE",  r"\n"),                # Quebra de linha
+    ("IDENTIFIER", r"[a-zA-Z_][a-zA-Z0-9_]*"),  # Identificadores (e print)
     ("NUMBER",   r"\d+(\.\d+)?"),       # Números inteiros ou decimais
-    ("PRINT",    r"\bprint\b"),         # Função print
-    ("IDENTIFIER", r"[a-zA-Z_][a-zA-Z0-9_]*"),  # Identificadores
     ("ASSIGN",   r"="),                 # Operador de atribuição
     ("PLUS",     r"\+"),                # +
     ("MINUS",    r"-"),                 # -
@@ -13,8 +16,6 @@ TOKEN_SPEC = [
     ("DIVIDE",   r"/"),                 # /
     ("LPAREN",   r"\("),                # (
     ("RPAREN",   r"\)"),                # )
-    ("NEWLINE",  r"\n"),                # Quebra de linha
-    ("SKIP",     r"[ \t]+"),            # Espaços e tabs
     ("COMMENT",  r"#.*"),               # Comentários
 ]
 
@@ -22,36 +23,39 @@ TOKEN_SPEC = [
 token_regex = "|".join(f"(?P<{name}>{regex})" for name, regex in TOKEN_SPEC)
 pattern = re.compile(token_regex)
 
+# Tokens que não vão para a saída
+IGNORED = {"NEWLINE", "SKIP", "COMMENT"}
+
 def lexer(code):
-    line_num = 1
-    line_start = 0
+    prev_end = 0
     tokens = []
+    append = tokens.append
 
     for mo in pattern.finditer(code):
+        start, end = mo.span()
+        # Qualquer lacuna entre dois matches é um caracter inválido
+        if start != prev_end:
+            invalid_token(code, prev_end)
+        prev_end = end
+
         kind = mo.lastgroup
+        if kind in IGNORED:
+            continue
         value = mo.group()
-        column = mo.start() - line_start + 1
+        if kind == "IDENTIFIER" and value == "print":
+            kind = "PRINT"
+        append((value, kind))
+
+    if prev_end != len(code):
+        invalid_token(code, prev_end)
 
-        if kind == "NEWLINE":
-            line_num += 1
-            line_start = mo.end()
-        elif kind == "SKIP" or kind == "COMMENT":
-            continue
-        else:
-            tokens.append((value, kind))
-    
-    # Verificar se há algum caracter inválido
-    pos = 0
-    while pos < len(code):
-        match = pattern.match(code, pos)
-        if not match:
-            line = code.count("\n", 0, pos) + 1
-            col = pos - code.rfind("\n", 0, pos)
-            raise SyntaxError(f"Erro: token inválido '{code[pos]}' na linha {line}, coluna {col}")
-        pos = match.end()
-    
     return tokens
 
+def invalid_token(code, pos):
+    line = code.count("\n", 0, pos) + 1
+    col = pos - code.rfind("\n", 0, pos)
+    raise SyntaxError(f"Erro: token inválido '{code[pos]}' na linha {line}, coluna {col}")
+
 def main():
     if len(sys.argv) != 2:
         print("Uso: python lexer.py <arquivo.nanocalc>")
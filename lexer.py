@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import re
-from typing import Iterator, Optional
+from bisect import bisect_left
+from typing import Iterable, Iterator
 
 from .buffer import InputBuffer
 from .token import Token
@@ -25,18 +26,19 @@ KEYWORDS = {
 }
 
 # Regex parts (kept close to docs/especificacao_lexica.md)
-_RE_WHITESPACE = re.compile(r"[\t\f\r\n ]+")
-_RE_COMMENT_LINE = re.compile(r"#[^\n]*")
-_RE_COMMENT_BLOCK = re.compile(r"/\*[^*]*\*+(?:[^/*][^*]*\*+)*/", re.DOTALL)
+_RE_WHITESPACE = r"[\t\f\r\n ]+"
+_RE_NEWLINE = re.compile(r"\n")
+_RE_COMMENT_LINE = r"#[^\n]*"
+_RE_COMMENT_BLOCK = r"/\*[^*]*\*+(?:[^/*][^*]*\*+)*/"
 
 # Strings: single or double quotes, no literal newlines, allow escapes like \n, \t, \\, \", \'
-_RE_STRING = re.compile(r"'(?:[^\\'\n]|\\.)*'|\"(?:[^\\\"\n]|\\.)*\"")
+_RE_STRING = r"'(?:[^\\'\n]|\\.)*'|\"(?:[^\\\"\n]|\\.)*\""
 
 # Numbers:
 # INT: [0-9]+
 # DEC: (?:[0-9]+\.[0-9]*|\.[0-9]+)
 # SCI: (?: (?:[0-9]+(?:\.[0-9]*)?|\.[0-9]+) [eE] [+-]? [0-9]+ )
-_RE_NUMBER = re.compile(
+_RE_NUMBER = (
     r"(?:"
     r"(?:[0-9]+(?:\.[0-9]*)?|\.[0-9]+)[eE][+-]?[0-9]+"
     r"|(?:[0-9]+\.[0-9]*|\.[0-9]+)"
@@ -44,7 +46,7 @@ _RE_NUMBER = re.compile(
     r")"
 )
 
-_RE_ID = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_RE_ID = r"[A-Za-z_][A-Za-z0-9_]*"
 
 # Operators and delimiters (maximal munch)
 OPERATORS_2 = {
@@ -81,105 +83,125 @@ DELIMS = {
 }
 
 
+def _alternation(literals: Iterable[str]) -> str:
+    return "|".join(re.escape(lit) for lit in literals)
+
+
+# Single-char operators and delimiters share one regex class and are resolved
+# by indexing this table with ord(ch) instead of probing two dicts.
+_CHAR_LITERALS = {**OPERATORS_1, **DELIMS}
+_CHAR_TABLE: tuple[str, ...] = tuple(_CHAR_LITERALS.get(chr(c), "") for c in range(128))
+
+
+# Single master pattern, tried left to right at each position. The order mirrors the
+# old probe sequence; the UNCLOSED_* / INVALID groups only exist to report errors.
+_TOKEN_SPEC = [
+    ("WS", _RE_WHITESPACE),
+    ("COMMENT_LINE", _RE_COMMENT_LINE),
+    ("COMMENT_BLOCK", _RE_COMMENT_BLOCK),
+    ("UNCLOSED_COMMENT", r"/\*"),
+    ("STRING", _RE_STRING),
+    ("UNCLOSED_STRING", r"['\"]"),
+    ("NUMBER", _RE_NUMBER),
+    ("OP2", _alternation(OPERATORS_2)),
+    ("CHAR", "[" + "".join(re.escape(ch) for ch in _CHAR_LITERALS) + "]"),
+    ("ID", _RE_ID),
+    ("INVALID", r"."),
+]
+_MASTER = re.compile("|".join(f"(?P<{name}>{pat})" for name, pat in _TOKEN_SPEC))
+
+# Group numbers, so the scanner dispatches on mo.lastindex (an int) instead of
+# mo.lastgroup. The sub-patterns only use (?:...) groups, so the numbers follow
+# _TOKEN_SPEC order and the skipped kinds (WS, comments) are the first three.
+_G_SKIP_MAX = _MASTER.groupindex["COMMENT_BLOCK"]
+if [_MASTER.groupindex[k] for k in ("WS", "COMMENT_LINE", "COMMENT_BLOCK")] != [1, 2, 3]:
+    raise RuntimeError("skipped kinds must be the first three groups of _TOKEN_SPEC")
+_G_UNCLOSED_COMMENT = _MASTER.groupindex["UNCLOSED_COMMENT"]
+_G_STRING = _MASTER.groupindex["STRING"]
+_G_UNCLOSED_STRING = _MASTER.groupindex["UNCLOSED_STRING"]
+_G_NUMBER = _MASTER.groupindex["NUMBER"]
+_G_OP2 = _MASTER.groupindex["OP2"]
+_G_CHAR = _MASTER.groupindex["CHAR"]
+_G_ID = _MASTER.groupindex["ID"]
+
+
 class Lexer:
     """NanoCalc lexer (regex-based with maximal munch & good errors).
 
     Produces Token objects with line/column.
     """
 
-    def __init__(self, buffer: InputBuffer):
-        self.buf = buffer
-        self.line = 1
-        self.col = 1
-
-    def _advance(self, text: str) -> None:
-        """Advance cursor and keep line/column consistent."""
-        for ch in text:
-            if ch == "\n":
-                self.line += 1
-                self.col = 1
-            else:
-                self.col += 1
-        self.buf.advance(len(text))
-
-    def _match(self, regex: re.Pattern[str]) -> Optional[str]:
-        m = regex.match(self.buf.remaining())
-        return m.group(0) if m else None
-
-    def next_token(self) -> Token:
-        # Skip whitespace/comments repeatedly
-        while not self.buf.eof():
-            start_line, start_col = self.line, self.col
-            rem = self.buf.remaining()
-
-            # Whitespace
-            ws = self._match(_RE_WHITESPACE)
-            if ws:
-                self._advance(ws)
+    def __init__(self, buffer: str | InputBuffer):
+        # Older call sites wrap the text in a buffer; its cursor is moved to the end at EOF
+        if isinstance(buffer, InputBuffer):
+            self._buf: InputBuffer | None = buffer
+            self.src, self.start = buffer.text, buffer.pos
+        else:
+            self._buf = None
+            self.src, self.start = buffer, 0
+        # Offsets of every newline in the source, so (line, column) is a bisect away
+        self._newlines = [m.start() for m in _RE_NEWLINE.finditer(self.src)]
+        # A LexerError ends the scan; keep it so later calls raise it again
+        self._error: LexerError | None = None
+        self._tokens = self._scan()
+
+    def _locate(self, pos: int) -> tuple[int, int]:
+        """Return the 1-based (line, column) of offset pos."""
+        k = bisect_left(self._newlines, pos)
+        return k + 1, pos - (self._newlines[k - 1] if k else -1)
+
+    def _scan(self) -> Iterator[Token]:
+        for mo in _MASTER.finditer(self.src, self.start):
+            g = mo.lastindex
+            assert g is not None  # every alternative is a named group
+            if g <= _G_SKIP_MAX:
                 continue
 
-            # Line comment
-            lc = self._match(_RE_COMMENT_LINE)
-            if lc:
-                self._advance(lc)
-                continue
+            value = mo.group()
+            line, col = self._locate(mo.start())
+            if g == _G_ID:
+                yield Token(KEYWORDS.get(value, "ID"), value, line, col)
+            elif g == _G_CHAR:
+                yield Token(_CHAR_TABLE[ord(value)], value, line, col)
+            elif g == _G_NUMBER:
+                yield Token("NUMBER", value, line, col)
+            elif g == _G_STRING:
+                yield Token("STRING", value, line, col)
+            elif g == _G_OP2:
+                yield Token(OPERATORS_2[value], value, line, col)
+            else:
+                if g == _G_UNCLOSED_COMMENT:
+                    msg = "comentário de bloco não terminado"
+                elif g == _G_UNCLOSED_STRING:
+                    msg = "string não terminada"
+                else:
+                    msg = f"caractere inválido {value!r}"
+                self._error = LexerError(f"Erro léxico na linha {line}, coluna {col}: {msg}")
+                raise self._error
+
+        end = len(self.src)
+        if self._buf is not None:
+            self._buf.pos = end
+        eof = Token("EOF", "", *self._locate(end))
+        while True:
+            yield eof
 
-            # Block comment (must be closed)
-            if rem.startswith("/*"):
-                bc = self._match(_RE_COMMENT_BLOCK)
-                if bc:
-                    self._advance(bc)
-                    continue
-                raise LexerError(
-                    f"Erro léxico na linha {start_line}, coluna {start_col}: comentário de bloco não terminado"
-                )
-
-            # String (must be closed)
-            if rem.startswith(("'", '"')):
-                s = self._match(_RE_STRING)
-                if s:
-                    tok = Token("STRING", s, start_line, start_col)
-                    self._advance(s)
-                    return tok
-                raise LexerError(f"Erro léxico na linha {start_line}, coluna {start_col}: string não terminada")
-
-            # Operators (2 chars first)
-            two = rem[:2]
-            if two in OPERATORS_2:
-                tok = Token(OPERATORS_2[two], two, start_line, start_col)
-                self._advance(two)
-                return tok
-
-            one = rem[:1]
-            if one in OPERATORS_1:
-                tok = Token(OPERATORS_1[one], one, start_line, start_col)
-                self._advance(one)
-                return tok
-
-            if one in DELIMS:
-                tok = Token(DELIMS[one], one, start_line, start_col)
-                self._advance(one)
-                return tok
-
-            # Number (note: '.' only valid when part of DEC/SCI by regex)
-            num = self._match(_RE_NUMBER)
-            if num:
-                tok = Token("NUMBER", num, start_line, start_col)
-                self._advance(num)
-                return tok
-
-            # Identifier / Keyword
-            ident = self._match(_RE_ID)
-            if ident:
-                ttype = KEYWORDS.get(ident, "ID")
-                tok = Token(ttype, ident, start_line, start_col)
-                self._advance(ident)
-                return tok
-
-            bad = rem[0]
-            raise LexerError(f"Erro léxico na linha {start_line}, coluna {start_col}: caractere inválido {bad!r}")
-
-        return Token("EOF", "", self.line, self.col)
+    def next_token(self) -> Token:
+        if self._error is not None:
+            raise self._error
+        return next(self._tokens)
+
+    def tokenize_all(self) -> list[Token]:
+        """Scan the rest of the input at once; the last token is always EOF."""
+        if self._error is not None:
+            raise self._error
+        tokens: list[Token] = []
+        append = tokens.append
+        for t in self._tokens:
+            append(t)
+            if t.type == "EOF":
+                break
+        return tokens
 
     def tokenize(self) -> Iterator[Token]:
         while True:
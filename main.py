@@ -3,14 +3,13 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
-from .lexer.buffer import InputBuffer
 from .lexer.lexer import Lexer, LexerError
 from .parser.parser import Parser, ParserError
 
 
 def run_lex(path: Path) -> int:
     source = path.read_text(encoding="utf-8")
-    lexer = Lexer(InputBuffer(source))
+    lexer = Lexer(source)
     print(f"{'TYPE':<12} {'VALUE':<20} @ (line,col)")
     print("-" * 60)
     try:
@@ -24,10 +23,9 @@ def run_lex(path: Path) -> int:
 
 def run_parse(path: Path) -> int:
     source = path.read_text(encoding="utf-8")
-    lexer = Lexer(InputBuffer(source))
-    parser = Parser(lexer)
+    lexer = Lexer(source)
     try:
-        parser.parse_program()
+        Parser(lexer).parse_program()
         print("OK: parsing concluído (nenhum erro sintático encontrado).")
         return 0
     except (LexerError, ParserError) as e:
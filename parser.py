@@ -11,7 +11,28 @@ class ParserError(Exception):
     pass
 
 
-@dataclass
+# Binary operators: token type -> (precedence, AST kind). Higher binds tighter.
+_BINOPS = {
+    "OR": (1, "Or"),
+    "AND": (2, "And"),
+    "EQ": (3, "EQ"),
+    "NEQ": (3, "NEQ"),
+    "LT": (4, "LT"),
+    "LE": (4, "LE"),
+    "GT": (4, "GT"),
+    "GE": (4, "GE"),
+    "PLUS": (5, "PLUS"),
+    "MINUS": (5, "MINUS"),
+    "MULTIPLY": (6, "MULTIPLY"),
+    "DIVIDE": (6, "DIVIDE"),
+    "MOD": (6, "MOD"),
+}
+
+# Prefix operators: token type -> AST kind
+_UNARY = {"NOT": "UnaryNOT", "MINUS": "UnaryMINUS", "PLUS": "UnaryPLUS"}
+
+
+@dataclass(slots=True)
 class ASTNode:
     """Tiny AST placeholder (enough to prove parsing works)."""
     kind: str
@@ -29,21 +50,27 @@ class Parser:
 
     def __init__(self, lexer: Lexer):
         self.lexer = lexer
-        self.lookahead: Token = self.lexer.next_token()
+        self.tokens = lexer.tokenize_all()
+        self.pos = 0
+        self.lookahead: Token = self.tokens[0]
 
     def _eat(self, expected_type: str) -> Token:
-        if self.lookahead.type == expected_type:
-            cur = self.lookahead
-            self.lookahead = self.lexer.next_token()
+        cur = self.lookahead
+        if cur.type == expected_type:
+            self.pos += 1
+            self.lookahead = self.tokens[self.pos]
             return cur
         raise ParserError(
-            f"Erro sintático: esperado {expected_type}, encontrado {self.lookahead.type} "
-            f"na linha {self.lookahead.line}, coluna {self.lookahead.column}"
+            f"Erro sintático: esperado {expected_type}, encontrado {cur.type} "
+            f"na linha {cur.line}, coluna {cur.column}"
         )
 
     def _accept(self, token_type: str) -> Optional[Token]:
-        if self.lookahead.type == token_type:
-            return self._eat(token_type)
+        cur = self.lookahead
+        if cur.type == token_type:
+            self.pos += 1
+            self.lookahead = self.tokens[self.pos]
+            return cur
         return None
 
     # program → { statement }
@@ -200,83 +227,47 @@ class Parser:
     # Expressions (classic precedence)
     # =============================
     def parse_expr(self) -> ASTNode:
-        return self.parse_or()
-
-    def parse_or(self) -> ASTNode:
-        node = self.parse_and()
-        while self._accept("OR"):
-            rhs = self.parse_and()
-            node = ASTNode("Or", left=node, right=rhs)
-        return node
-
-    def parse_and(self) -> ASTNode:
-        node = self.parse_equality()
-        while self._accept("AND"):
-            rhs = self.parse_equality()
-            node = ASTNode("And", left=node, right=rhs)
-        return node
-
-    def parse_equality(self) -> ASTNode:
-        node = self.parse_comparison()
-        while self.lookahead.type in ("EQ", "NEQ"):
-            op = self.lookahead.type
-            self._eat(op)
-            rhs = self.parse_comparison()
-            node = ASTNode(op, left=node, right=rhs)
-        return node
-
-    def parse_comparison(self) -> ASTNode:
-        node = self.parse_term()
-        while self.lookahead.type in ("LT", "LE", "GT", "GE"):
-            op = self.lookahead.type
-            self._eat(op)
-            rhs = self.parse_term()
-            node = ASTNode(op, left=node, right=rhs)
-        return node
-
-    def parse_term(self) -> ASTNode:
-        node = self.parse_factor()
-        while self.lookahead.type in ("PLUS", "MINUS"):
-            op = self.lookahead.type
-            self._eat(op)
-            rhs = self.parse_factor()
-            node = ASTNode(op, left=node, right=rhs)
-        return node
-
-    def parse_factor(self) -> ASTNode:
+        return self.parse_binop(1)
+
+    # Precedence climbing over _BINOPS (left-associative at every level)
+    def parse_binop(self, min_prec: int) -> ASTNode:
         node = self.parse_unary()
-        while self.lookahead.type in ("MULTIPLY", "DIVIDE", "MOD"):
-            op = self.lookahead.type
-            self._eat(op)
-            rhs = self.parse_unary()
-            node = ASTNode(op, left=node, right=rhs)
-        return node
+        while True:
+            op = _BINOPS.get(self.lookahead.type)
+            if op is None or op[0] < min_prec:
+                return node
+            prec, kind = op
+            self.pos += 1
+            self.lookahead = self.tokens[self.pos]
+            rhs = self.parse_binop(prec + 1)
+            node = ASTNode(kind, None, node, rhs)
 
     def parse_unary(self) -> ASTNode:
-        if self.lookahead.type in ("NOT", "MINUS", "PLUS"):
-            op = self.lookahead.type
-            self._eat(op)
+        kind = _UNARY.get(self.lookahead.type)
+        if kind is not None:
+            self.pos += 1
+            self.lookahead = self.tokens[self.pos]
             rhs = self.parse_unary()
-            return ASTNode("Unary" + op, left=rhs)
+            return ASTNode(kind, None, rhs)
         return self.parse_primary()
 
     def parse_primary(self) -> ASTNode:
         if self.lookahead.type == "NUMBER":
             t = self._eat("NUMBER")
-            return ASTNode("Number", value=t.value)
+            return ASTNode("Number", t.value)
         if self.lookahead.type == "STRING":
             t = self._eat("STRING")
-            return ASTNode("String", value=t.value)
+            return ASTNode("String", t.value)
         if self.lookahead.type in ("KW_TRUE", "KW_FALSE"):
             t = self._eat(self.lookahead.type)
-            return ASTNode("Bool", value=t.value)
+            return ASTNode("Bool", t.value)
         if self.lookahead.type == "ID":
             ident = self._eat("ID")
             # call?
             if self.lookahead.type == "LPAREN":
                 self.parse_callSuffix()
-                return ASTNode("Call", value=ident.value)
-            return ASTNode("Id", value=ident.value)
+                return ASTNode("Call", ident.value)
+            return ASTNode("Id", ident.value)
         if self._accept("LPAREN"):
             node = self.parse_expr()
             self._eat("RPAREN")